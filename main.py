@@ -1,29 +1,48 @@
 from pet import Pet
 import time  # Import the time module
 
-if __name__ == "__main__":
-    my_basic_pet = Pet(name="Buddy", species="Dog")
+def run(pet: Pet, ticks: int = 3, dt: int = 3600, verbose: bool = True, realtime: bool = False) -> None:
+    """Runs the demo interaction and time simulation; verbose=False and realtime=False make it usable for benchmarks.
+
+    Unless realtime is set, the pet runs on a simulated clock that moves forward dt seconds per tick.
+    """
+    now = [0.0]
+    # verbose=False also skips the pet's own messages
+    saved_clock, saved_emit = pet.attach(time.time if realtime else (lambda: now[0]), print if verbose else None)
+    try:
+        if verbose:
+            print("--- Initial Status ---")
+            pet.get_status()
 
-    print("--- Initial Status ---")
-    my_basic_pet.get_status()
+            print(f"\n--- Interacting with {pet.name} ---")
+        pet.eat()
+        pet.play()
+        pet.train("Sit")
+        if verbose:
+            pet.show_tricks()
+        pet.sleep()
 
-    print("\n--- Interacting with Buddy ---")
-    my_basic_pet.eat()
-    my_basic_pet.play()
-    my_basic_pet.train("Sit")
-    my_basic_pet.show_tricks()
-    my_basic_pet.sleep()
+        if verbose:
+            print("\n--- Status After Interaction ---")
+            pet.get_status()
 
-    print("\n--- Status After Interaction ---")
-    my_basic_pet.get_status()
+            print("\n--- Time Passing (Simulated) ---")
+        for _ in range(ticks):
+            if not realtime:
+                now[0] += dt
+            pet.time_passes(dt) # Simulate dt seconds passing
+            if verbose:
+                pet.get_status()
+            if not pet.is_alive():
+                break
+            if realtime:
+                time.sleep(0.5) # Small delay for output readability
 
-    print("\n--- Time Passing (Simulated) ---")
-    for _ in range(3):
-        my_basic_pet.time_passes(3600) # Simulate 1 hour passing
-        my_basic_pet.get_status()
-        if not my_basic_pet.is_alive():
-            break
-        time.sleep(0.5) # Small delay for output readability
+        if pet.is_alive() and verbose:
+            print(f"\n{pet.name} is still doing well!")
+    finally:
+        pet.attach(saved_clock, saved_emit) # Simulated time is already applied; resume from the pet's own clock
 
-    if my_basic_pet.is_alive():
-        print("\nBuddy is still doing well!")
\ No newline at end of file
+if __name__ == "__main__":
+    my_basic_pet = Pet(name="Buddy", species="Dog")
+    run(my_basic_pet, realtime=True)
\ No newline at end of file
@@ -1,13 +1,44 @@
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional, Set, Tuple
 import random
 import time
 
+def _clamp10(value: int) -> int:
+    """Clamps a need value to the 0-10 range without the max()/min() call overhead."""
+    return 0 if value < 0 else (10 if value > 10 else value)
+
+def _no_mood_change(pet: 'Pet') -> None:
+    pass
+
+def _fuse_mood_modifiers(modifiers: List[Callable[['Pet'], None]]) -> Callable[['Pet'], None]:
+    """Compiles the modifiers into one function that calls each of them in order, with no loop."""
+    if not modifiers:
+        return _no_mood_change
+    namespace = {f"m{i}": modifier for i, modifier in enumerate(modifiers)}
+    body = "".join(f"    m{i}(pet)\n" for i in range(len(modifiers)))
+    exec(f"def fused(pet):\n{body}", namespace)
+    return namespace["fused"]
+
+def _build_decay(metabolism: float, activity: float, sociability: float) -> Callable[['Needs', float], bool]:
+    """Builds the time_passes needs update with the decay periods bound as default arguments (fast locals).
+
+    The returned function reports whether the pet died of neglect.
+    """
+    def decay(needs: 'Needs', elapsed: float,
+              hunger_period: float = 3600 / (3 + 2 * metabolism), # Metabolism affects hunger rate
+              energy_period: float = 7200 / (5 + 3 * activity), # Activity affects energy drain
+              happiness_period: float = 10800 / (2 + 1 * sociability)) -> bool: # Sociability affects happiness drop when alone
+        needs.apply_delta(int(elapsed / hunger_period), -int(elapsed / energy_period), -int(elapsed / happiness_period))
+        return needs.hunger >= 10 or needs.energy <= 0 or needs.happiness <= 0
+    return decay
+
 class Needs:
     """Represents the basic needs of a pet."""
+    __slots__ = ('_hunger', '_energy', '_happiness')
+
     def __init__(self, initial_hunger: int = 5, initial_energy: int = 7, initial_happiness: int = 5):
-        self._hunger = max(0, min(10, initial_hunger))
-        self._energy = max(0, min(10, initial_energy))
-        self._happiness = max(0, min(10, initial_happiness))
+        self._hunger = _clamp10(initial_hunger)
+        self._energy = _clamp10(initial_energy)
+        self._happiness = _clamp10(initial_happiness)
 
     @property
     def hunger(self) -> int:
@@ -15,7 +46,7 @@ class Needs:
 
     @hunger.setter
     def hunger(self, value: int):
-        self._hunger = max(0, min(10, value))
+        self._hunger = _clamp10(value)
 
     @property
     def energy(self) -> int:
@@ -23,7 +54,7 @@ class Needs:
 
     @energy.setter
     def energy(self, value: int):
-        self._energy = max(0, min(10, value))
+        self._energy = _clamp10(value)
 
     @property
     def happiness(self) -> int:
@@ -31,134 +62,255 @@ class Needs:
 
     @happiness.setter
     def happiness(self, value: int):
-        self._happiness = max(0, min(10, value))
+        self._happiness = _clamp10(value)
+
+    def apply_delta(self, hunger: int = 0, energy: int = 0, happiness: int = 0) -> None:
+        """Adjusts all three needs in one call, clamping each to 0-10 inline instead of through the setters."""
+        # Same clamp as _clamp10, written out so this hot path makes no extra function calls
+        h = self._hunger + hunger
+        e = self._energy + energy
+        hp = self._happiness + happiness
+        self._hunger = 0 if h < 0 else (10 if h > 10 else h)
+        self._energy = 0 if e < 0 else (10 if e > 10 else e)
+        self._happiness = 0 if hp < 0 else (10 if hp > 10 else hp)
 
     def __str__(self) -> str:
         return f"Hunger: {self.hunger}/10, Energy: {self.energy}/10, Happiness: {self.happiness}/10"
 
+def _clamp_traits(traits: Dict[str, float]) -> Dict[str, float]:
+    return {trait: max(0.0, min(1.0, value)) for trait, value in traits.items()}
+
 class Personality:
     """Represents the personality traits of a pet, influencing its behavior."""
+    __slots__ = ('name', 'traits')
+
     def __init__(self, name: str, traits: Dict[str, float]):
         self.name = name
-        self.traits = {trait: max(0.0, min(1.0, value)) for trait, value in traits.items()}
+        self.traits = _clamp_traits(traits)
 
     def get_trait_influence(self, trait: str) -> float:
         return self.traits.get(trait, 0.5)  # Default to neutral if trait not found
 
 class Pet:
     """Represents a digital pet with basic needs and actions."""
+    __slots__ = ('name', 'species', 'needs', 'tricks', '_tricks_lc', '_tricks_str', '_traits', '_personality', '_is_alive',
+                 '_clock', '_emit', '_on_death', '_last_interaction', '_mood_modifiers', '_fused_mood', '_random', '_randint',
+                 '_met', '_act', '_soc', '_pick', '_joy', '_laz', '_play', '_fuss', '_train',
+                 '_decay',
+                 '_eat_hunger_reduction', '_eat_happiness_inc', '_sleep_energy_inc',
+                 '_play_energy_dec', '_play_happiness_inc', '_play_hunger_inc', '_train_success_chance')
+
     def __init__(self, name: str, species: str = "Generic Pet", initial_hunger: int = 5, initial_energy: int = 7, initial_happiness: int = 5, personality_traits: Dict[str, float] = None):
         self.name = name
         self.species = species
         self.needs = Needs(initial_hunger, initial_energy, initial_happiness)
         self.tricks: List[str] = []
-        self.personality = Personality(f"{name}'s Personality", personality_traits if personality_traits else {})
+        self._tricks_lc: Set[str] = set() # Lowercased tricks for case-insensitive lookups
+        self._tricks_str: Optional[str] = None # Cached ', '-joined tricks, cleared when a trick is learned
+        self._traits = _clamp_traits(personality_traits) if personality_traits else {}
+        self._personality: Optional[Personality] = None
         self._is_alive = True
-        self._last_interaction = time.time()
+        self._clock: Callable[[], float] = time.time # A PetWorld swaps this for its simulated clock
+        self._emit: Optional[Callable[[str], None]] = print # Message sink; None skips building messages at all
+        self._on_death: Optional[Callable[[], None]] = None # Lets a PetWorld keep its alive column in sync
+        self._last_interaction = self._clock()
         self._mood_modifiers: List[Callable[['Pet'], None]] = []
+        self._fused_mood: Callable[['Pet'], None] = _no_mood_change
+        # Random sources; a PetWorld swaps these for its buffered generator
+        self._random: Callable[[], float] = random.random
+        self._randint: Callable[[int, int], int] = random.randint
+        self._cache_traits()
+        self._decay = _build_decay(self._met, self._act, self._soc)
+
+    def _cache_traits(self) -> None:
+        """Looks the traits up once, along with the action effects that depend only on them."""
+        (self._met, self._act, self._soc, self._pick, self._joy, self._laz, self._play, self._fuss, self._train) = (
+            self.trait(name) for name in ("metabolism", "activity", "sociability", "pickiness", "joyfulness",
+                                          "laziness", "playfulness", "fussiness", "trainability"))
+        self._eat_hunger_reduction = int(3 - 1 * self._pick) # Pickier pets eat less
+        self._eat_happiness_inc = int(1 + 0.5 * self._joy) # Joyful pets get happier
+        self._sleep_energy_inc = int(5 + 2 * self._laz) # Lazier pets sleep more deeply
+        self._play_energy_dec = int(2 + 1 * (1 - self._play)) # Less playful pets get tired faster
+        self._play_happiness_inc = int(2 + 0.8 * self._play) # More playful pets get happier
+        self._play_hunger_inc = int(1 + 0.3 * (1 - self._fuss)) # Less fussy pets get hungrier easier
+        self._train_success_chance = 0.6 + 0.3 * self._train # More trainable pets learn faster
+
+    @property
+    def personality(self) -> Personality:
+        """The pet's Personality object, only built if something asks for it.
+
+        Traits are cached when set, so editing personality.traits in place has no effect on behaviour;
+        assign a new Personality instead.
+        """
+        if self._personality is None:
+            self._personality = Personality(f"{self.name}'s Personality", self._traits)
+        return self._personality
+
+    @personality.setter
+    def personality(self, personality: Personality):
+        self._personality = personality
+        self._traits = dict(personality.traits)
+        self._cache_traits()
+        if isinstance(self.needs, Needs): # A PetWorld owns decay for its pets, from its own trait columns
+            self._decay = _build_decay(self._met, self._act, self._soc)
+
+    def trait(self, name: str) -> float:
+        """Returns a personality trait value without going through a Personality object."""
+        return self._traits.get(name, 0.5)  # Default to neutral if trait not found
+
+    def attach(self, clock: Callable[[], float], emit: Optional[Callable[[str], None]]) -> Tuple[Callable[[], float], Optional[Callable[[str], None]]]:
+        """Switches the pet to another clock and message sink and returns the previous pair, for restoring later.
+
+        emit=None skips building messages. Time since the last interaction restarts from now on the new clock.
+        """
+        previous = (self._clock, self._emit)
+        self._clock = clock
+        self._emit = emit
+        self._last_interaction = clock()
+        return previous
+
+    _UNPICKLED_SLOTS = ('_decay', '_fused_mood', '_random', '_randint', '_clock', '_emit', '_on_death')
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Returns the state for pickle, which copy.copy and copy.deepcopy use as well.
+
+        So a copy of a PetWorld pet is a standalone pet: its needs are copied into a plain Needs,
+        and its clock, messages and random sources go back to the defaults.
+        """
+        # Generated functions can't be pickled, and the hooks may belong to a PetWorld or the
+        # global random instance; __setstate__ resets them all to a standalone pet's defaults
+        state = {slot: getattr(self, slot) for cls in type(self).__mro__
+                 for slot in getattr(cls, '__slots__', ()) if hasattr(self, slot) and slot not in self._UNPICKLED_SLOTS}
+        if hasattr(self, '__dict__'): # Subclasses without __slots__ keep their own attributes here
+            state.update(self.__dict__)
+        if not isinstance(self.needs, Needs): # A PetWorld row; copy it out so the world isn't pickled too
+            state['needs'] = Needs(self.needs.hunger, self.needs.energy, self.needs.happiness)
+            state['_last_interaction'] = time.time()
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._decay = _build_decay(self._met, self._act, self._soc)
+        self._fused_mood = _fuse_mood_modifiers(self._mood_modifiers)
+        self._random = random.random
+        self._randint = random.randint
+        self._clock = time.time
+        self._emit = print
+        self._on_death = None
 
     def eat(self) -> None:
         """Reduces hunger and increases happiness."""
         if not self._is_alive:
-            print(f"{self.name} is no longer with us and cannot eat.")
+            if self._emit:
+                self._emit(f"{self.name} is no longer with us and cannot eat.")
             return
-        print(f"{self.name} is eating...")
-        hunger_reduction = 3 - 1 * self.personality.get_trait_influence("pickiness") # Pickier pets eat less
-        self.needs.hunger = max(0, self.needs.hunger - int(hunger_reduction))
-        happiness_increase = 1 + 0.5 * self.personality.get_trait_influence("joyfulness") # Joyful pets get happier
-        self.needs.happiness = min(10, self.needs.happiness + int(happiness_increase))
-        self._last_interaction = time.time()
+        if self._emit:
+            self._emit(f"{self.name} is eating...")
+        self.needs.apply_delta(hunger=-self._eat_hunger_reduction, happiness=self._eat_happiness_inc)
+        self._last_interaction = self._clock()
 
     def sleep(self) -> None:
         """Increases energy."""
         if not self._is_alive:
-            print(f"{self.name} is no longer with us and cannot sleep.")
+            if self._emit:
+                self._emit(f"{self.name} is no longer with us and cannot sleep.")
             return
-        print(f"{self.name} is sleeping...")
-        energy_increase = 5 + 2 * self.personality.get_trait_influence("laziness") # Lazier pets sleep more deeply
-        self.needs.energy = min(10, self.needs.energy + int(energy_increase))
-        self._last_interaction = time.time()
+        if self._emit:
+            self._emit(f"{self.name} is sleeping...")
+        self.needs.apply_delta(energy=self._sleep_energy_inc)
+        self._last_interaction = self._clock()
 
     def play(self) -> None:
         """Decreases energy, increases happiness, and increases hunger."""
         if not self._is_alive:
-            print(f"{self.name} is no longer with us and cannot play.")
+            if self._emit:
+                self._emit(f"{self.name} is no longer with us and cannot play.")
             return
-        print(f"{self.name} is playing!")
-        energy_decrease = 2 + 1 * (1 - self.personality.get_trait_influence("playfulness")) # Less playful pets get tired faster
-        self.needs.energy = max(0, self.needs.energy - int(energy_decrease))
-        happiness_increase = 2 + 0.8 * self.personality.get_trait_influence("playfulness") # More playful pets get happier
-        self.needs.happiness = min(10, self.needs.happiness + int(happiness_increase))
-        hunger_increase = 1 + 0.3 * (1 - self.personality.get_trait_influence("fussiness")) # Less fussy pets get hungrier easier
-        self.needs.hunger = min(10, self.needs.hunger + int(hunger_increase))
-        self._last_interaction = time.time()
+        if self._emit:
+            self._emit(f"{self.name} is playing!")
+        self.needs.apply_delta(self._play_hunger_inc, -self._play_energy_dec, self._play_happiness_inc)
+        self._last_interaction = self._clock()
 
     def get_status(self) -> None:
         """Prints the current state of the pet."""
+        if self._emit is None:
+            return
         if not self._is_alive:
-            print(f"{self.name} has passed away.")
+            self._emit(f"{self.name} has passed away.")
             return
-        print(f"--- {self.name} ({self.species}) ---")
-        print(self.needs)
+        self._emit(f"--- {self.name} ({self.species}) ---")
+        self._emit(str(self.needs))
         if self.tricks:
-            print(f"Tricks learned: {', '.join(self.tricks)}")
+            self._emit(f"Tricks learned: {self._joined_tricks()}")
         else:
-            print(f"{self.name} hasn't learned any tricks yet.")
+            self._emit(f"{self.name} hasn't learned any tricks yet.")
 
     def train(self, trick: str) -> None:
         """Teaches the pet a new trick."""
         if not self._is_alive:
-            print(f"{self.name} is no longer with us and cannot learn any new tricks.")
+            if self._emit:
+                self._emit(f"{self.name} is no longer with us and cannot learn any new tricks.")
             return
-        if trick.lower() not in [t.lower() for t in self.tricks]:
-            success_chance = 0.6 + 0.3 * self.personality.get_trait_influence("trainability") # More trainable pets learn faster
-            if random.random() < success_chance:
+        trick_lc = trick.lower()
+        if trick_lc not in self._tricks_lc:
+            if self._random() < self._train_success_chance:
                 self.tricks.append(trick)
-                print(f"{self.name} learned the trick '{trick}'!")
-                self.needs.happiness = min(10, self.needs.happiness + 2) # Happy after learning
+                self._tricks_str = None
+                self._tricks_lc.add(trick_lc)
+                if self._emit:
+                    self._emit(f"{self.name} learned the trick '{trick}'!")
+                self.needs.apply_delta(happiness=2) # Happy after learning
             else:
-                print(f"{self.name} struggled to learn '{trick}'. Try again later!")
-            self._last_interaction = time.time()
+                if self._emit:
+                    self._emit(f"{self.name} struggled to learn '{trick}'. Try again later!")
+            self._last_interaction = self._clock()
         else:
-            print(f"{self.name} already knows the trick '{trick}'.")
+            if self._emit:
+                self._emit(f"{self.name} already knows the trick '{trick}'.")
 
     def show_tricks(self) -> None:
         """Prints all learned tricks."""
+        if self._emit is None:
+            return
         if not self._is_alive:
-            print(f"{self.name} is no longer with us and cannot show any tricks.")
+            self._emit(f"{self.name} is no longer with us and cannot show any tricks.")
             return
         if self.tricks:
-            print(f"{self.name} knows the following tricks: {', '.join(self.tricks)}")
+            self._emit(f"{self.name} knows the following tricks: {self._joined_tricks()}")
         else:
-            print(f"{self.name} hasn't learned any tricks yet.")
+            self._emit(f"{self.name} hasn't learned any tricks yet.")
+
+    def _joined_tricks(self) -> str:
+        if self._tricks_str is None:
+            self._tricks_str = ', '.join(self.tricks)
+        return self._tricks_str
 
     def add_mood_modifier(self, modifier: Callable[['Pet'], None]) -> None:
         """Adds a function to modify the pet's mood over time."""
         self._mood_modifiers.append(modifier)
+        self._fused_mood = _fuse_mood_modifiers(self._mood_modifiers)
 
     def update_mood(self) -> None:
         """Applies all mood modifiers to the pet."""
-        for modifier in self._mood_modifiers:
-            modifier(self)
+        self._fused_mood(self)
 
     def time_passes(self, seconds: int) -> None:
         """Simulates the passage of time, affecting the pet's needs."""
         if not self._is_alive:
             return
-        time_elapsed = time.time() - self._last_interaction
+        now = self._clock()
+        time_elapsed = now - self._last_interaction
         if time_elapsed >= seconds:
-            hunger_increase = int(time_elapsed / (3600 / (3 + 2 * self.personality.get_trait_influence("metabolism")))) # Metabolism affects hunger rate
-            energy_decrease = int(time_elapsed / (7200 / (5 + 3 * self.personality.get_trait_influence("activity")))) # Activity affects energy drain
-            happiness_decrease = int(time_elapsed / (10800 / (2 + 1 * self.personality.get_trait_influence("sociability")))) # Sociability affects happiness drop when alone
+            died = self._decay(self.needs, time_elapsed)
+            self._last_interaction = now
 
-            self.needs.hunger = min(10, self.needs.hunger + hunger_increase)
-            self.needs.energy = max(0, self.needs.energy - energy_decrease)
-            self.needs.happiness = max(0, self.needs.happiness - happiness_decrease)
-            self._last_interaction = time.time()
-
-            if self.needs.hunger >= 10 or self.needs.energy <= 0 or self.needs.happiness <= 0:
+            if died:
                 self._is_alive = False
-                print(f"{self.name} has passed away due to neglect.")
+                if self._on_death:
+                    self._on_death()
+                if self._emit:
+                    self._emit(f"{self.name} has passed away due to neglect.")
 
     def is_alive(self) -> bool:
         """Checks if the pet is currently alive."""
@@ -166,10 +318,24 @@ class Pet:
 
 class AdvancedPet(Pet):
     """An advanced pet with more complex needs and behaviors."""
+    __slots__ = ('_health', '_diseases', '_diseases_lc', '_diseases_str', '_const', '_resil', '_coop',
+                 '_eat_health_inc', '_play_health_dec', '_treat_success_chance')
+
     def __init__(self, name: str, species: str = "Advanced Pet", initial_hunger: int = 5, initial_energy: int = 7, initial_happiness: int = 5, initial_health: int = 100, personality_traits: Dict[str, float] = None):
         super().__init__(name, species, initial_hunger, initial_energy, initial_happiness, personality_traits)
         self.health = max(0, min(100, initial_health))
         self._diseases: List[str] = []
+        self._diseases_lc: Set[str] = set()
+        self._diseases_str: Optional[str] = None
+
+    def _cache_traits(self) -> None:
+        super()._cache_traits()
+        self._const = self.trait("constitution")
+        self._resil = self.trait("resilience")
+        self._coop = self.trait("cooperativeness")
+        self._eat_health_inc = int(2 + 1 * self._const)
+        self._play_health_dec = int(3 - 1 * self._resil)
+        self._treat_success_chance = 0.7 * self._coop # More cooperative pets are easier to treat
 
     @property
     def health(self) -> int:
@@ -180,68 +346,91 @@ class AdvancedPet(Pet):
         self._health = max(0, min(100, value))
         if self._health <= 0 and self._is_alive:
             self._is_alive = False
-            print(f"{self.name} has succumbed to illness.")
+            if self._on_death:
+                self._on_death()
+            if self._emit:
+                self._emit(f"{self.name} has succumbed to illness.")
 
     def get_status(self) -> None:
         """Prints the current state of the advanced pet, including health and diseases."""
         super().get_status()
-        if self._is_alive:
-            print(f"Health: {self.health}/100")
+        if self._is_alive and self._emit:
+            self._emit(f"Health: {self.health}/100")
             if self._diseases:
-                print(f"Diseases: {', '.join(self._diseases)}")
+                self._emit(f"Diseases: {self._joined_diseases()}")
+
+    def _joined_diseases(self) -> str:
+        if self._diseases_str is None:
+            self._diseases_str = ', '.join(self._diseases)
+        return self._diseases_str
 
     def eat(self) -> None:
         super().eat()
         # Certain foods might slightly improve health
-        if random.random() < 0.3:
-            health_increase = 2 + 1 * self.personality.get_trait_influence("constitution")
-            self.health = min(100, self.health + int(health_increase))
+        if self._random() < 0.3:
+            self.health = self.health + self._eat_health_inc
 
     def play(self) -> None:
         super().play()
         # Overexertion might slightly decrease health
-        if self.needs.energy < 3 and random.random() < 0.4:
-            health_decrease = 3 - 1 * self.personality.get_trait_influence("resilience")
-            self.health = max(0, self.health - int(health_decrease))
+        if self.needs.energy < 3 and self._random() < 0.4:
+            self.health = self.health - self._play_health_dec
 
     def train(self, trick: str) -> None:
         super().train(trick)
         # Successful training might slightly boost health
-        if trick.lower() in [t.lower() for t in self.tricks] and random.random() < 0.2:
-            self.health = min(100, self.health + 1)
+        if trick.lower() in self._tricks_lc and self._random() < 0.2:
+            self.health = self.health + 1
 
     def contract_disease(self, disease: str) -> None:
         """Makes the pet contract a disease."""
-        if disease.lower() not in [d.lower() for d in self._diseases]:
+        disease_lc = disease.lower()
+        if disease_lc not in self._diseases_lc:
             self._diseases.append(disease)
-            print(f"{self.name} has contracted '{disease}'.")
+            self._diseases_lc.add(disease_lc)
+            self._diseases_str = None
+            if self._emit:
+                self._emit(f"{self.name} has contracted '{disease}'.")
             # Diseases can affect needs
-            self.needs.hunger = min(10, self.needs.hunger + random.randint(1, 3))
-            self.needs.energy = max(0, self.needs.energy - random.randint(1, 3))
-            self.needs.happiness = max(0, self.needs.happiness - random.randint(2, 4))
-            self.health = max(0, self.health - random.randint(5, 15))
+            self.needs.apply_delta(self._randint(1, 3), -self._randint(1, 3), -self._randint(2, 4))
+            self.health = self.health - self._randint(5, 15)
 
     def treat_disease(self, disease: str) -> None:
         """Attempts to treat a specific disease."""
-        if disease.lower() in [d.lower() for d in self._diseases]:
-            treatment_success_chance = 0.7 * self.personality.get_trait_influence("cooperativeness") # More cooperative pets are easier to treat
-            if random.random() < treatment_success_chance:
-                self._diseases.remove(disease)
-                print(f"{self.name} has been cured of '{disease}'.")
-                self.health = min(100, self.health + random.randint(5, 10))
+        disease_lc = disease.lower()
+        if disease_lc in self._diseases_lc:
+            if self._random() < self._treat_success_chance:
+                self._diseases = [d for d in self._diseases if d.lower() != disease_lc]
+                self._diseases_lc.discard(disease_lc)
+                self._diseases_str = None
+                if self._emit:
+                    self._emit(f"{self.name} has been cured of '{disease}'.")
+                self.health = self.health + self._randint(5, 10)
             else:
-                print(f"Treatment for '{disease}' was unsuccessful.")
+                if self._emit:
+                    self._emit(f"Treatment for '{disease}' was unsuccessful.")
         else:
-            print(f"{self.name} doesn't have '{disease}'.")
+            if self._emit:
+                self._emit(f"{self.name} doesn't have '{disease}'.")
 
     def time_passes(self, seconds: int) -> None:
         super().time_passes(seconds)
-        if self._is_alive:
-            # Diseases might worsen over time
-            for disease in list(self._diseases): # Iterate over a copy to allow modification
-                if random.random() < 0.2:
-                    print(f"{disease} is worsening for {self.name}.")
-                    self.health = max(0, self.health - random.randint(3, 7))
-                    self.needs.hunger = min(10, self.needs.hunger + random.randint(0, 2))
-                    self.needs.energy = max(0, self.needs.energy - random.randint(0, 2))
-                    self.needs.happiness = max(0, self.needs.happiness - random.randint(1, 3))
\ No newline at end of file
+        self._progress_diseases()
+
+    def _progress_diseases(self) -> None:
+        """Gives each disease a chance to worsen; a PetWorld calls this after its own tick."""
+        if self._is_alive and self._diseases:
+            # Diseases might worsen over time. Every effect pushes the same way,
+            # so the totals are applied once instead of clamping per disease.
+            health_loss = hunger_gain = energy_loss = happiness_loss = 0
+            for disease in self._diseases:
+                if self._random() < 0.2:
+                    if self._emit:
+                        self._emit(f"{disease} is worsening for {self.name}.")
+                    health_loss += self._randint(3, 7)
+                    hunger_gain += self._randint(0, 2)
+                    energy_loss += self._randint(0, 2)
+                    happiness_loss += self._randint(1, 3)
+            if health_loss:
+                self.health = self.health - health_loss
+                self.needs.apply_delta(hunger_gain, -energy_loss, -happiness_loss)
\ No newline at end of file
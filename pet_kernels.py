@@ -0,0 +1,42 @@
+from numba import cuda, njit, prange
+
+@njit("void(int8[:], int8[:], int8[:], uint8[:], uint8[:], uint8[:], float64[:], float64[:], float64[:], boolean[:], float64)",
+      parallel=True, cache=True, fastmath=True)
+def tick(hunger, energy, happiness, metabolism, activity, sociability, hunger_period, energy_period, happiness_period, alive, elapsed):
+    """Compiled per-pet version of PetWorld.time_passes; uint8 trait levels index the *_period tables."""
+    for i in prange(hunger.shape[0]):
+        if not alive[i]:
+            continue
+        hunger_increase = min(int(elapsed / hunger_period[metabolism[i]]), 10)
+        energy_decrease = min(int(elapsed / energy_period[activity[i]]), 10)
+        happiness_decrease = min(int(elapsed / happiness_period[sociability[i]]), 10)
+
+        h = min(10, hunger[i] + hunger_increase)
+        e = max(0, energy[i] - energy_decrease)
+        hp = max(0, happiness[i] - happiness_decrease)
+        hunger[i] = h
+        energy[i] = e
+        happiness[i] = hp
+
+        if h >= 10 or e <= 0 or hp <= 0:
+            alive[i] = False
+
+@cuda.jit
+def tick_gpu(hunger, energy, happiness, metabolism, activity, sociability, hunger_period, energy_period, happiness_period, alive, elapsed):
+    """CUDA version of tick, one thread per pet; launch with at least as many threads as pets."""
+    i = cuda.grid(1)
+    if i >= hunger.size or not alive[i]:
+        return
+    hunger_increase = min(int(elapsed / hunger_period[metabolism[i]]), 10)
+    energy_decrease = min(int(elapsed / energy_period[activity[i]]), 10)
+    happiness_decrease = min(int(elapsed / happiness_period[sociability[i]]), 10)
+
+    h = min(10, hunger[i] + hunger_increase)
+    e = max(0, energy[i] - energy_decrease)
+    hp = max(0, happiness[i] - happiness_decrease)
+    hunger[i] = h
+    energy[i] = e
+    happiness[i] = hp
+
+    if h >= 10 or e <= 0 or hp <= 0:
+        alive[i] = False
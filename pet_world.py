@@ -0,0 +1,206 @@
+from typing import List, Optional
+from functools import partial
+import sys
+import numpy as np
+
+from pet import Pet, AdvancedPet, _clamp10
+
+try:
+    from numba import cuda
+    from pet_kernels import tick, tick_gpu
+except ImportError:  # Numba not installed, fall back to plain NumPy
+    cuda = tick = tick_gpu = None
+
+# Traits are stored as uint8 fixed point (0-255 for 0.0-1.0), so each time_passes
+# divisor can be looked up per level instead of computed per pet
+_TRAIT_LEVELS = np.arange(256) / 255.0
+_HUNGER_PERIOD = 3600.0 / (3 + 2 * _TRAIT_LEVELS) # Metabolism affects hunger rate
+_ENERGY_PERIOD = 7200.0 / (5 + 3 * _TRAIT_LEVELS) # Activity affects energy drain
+_HAPPINESS_PERIOD = 10800.0 / (2 + 1 * _TRAIT_LEVELS) # Sociability affects happiness drop when alone
+
+def _decayed_by_world(needs: 'NeedsView', elapsed: float) -> bool:
+    """Stands in for a world pet's own decay, since PetWorld.time_passes already applied it."""
+    return False
+
+class NeedsView:
+    """Exposes one row of a PetWorld through the same interface as Needs."""
+    __slots__ = ('_world', '_index')
+
+    def __init__(self, world: 'PetWorld', index: int):
+        self._world = world
+        self._index = index
+
+    @property
+    def hunger(self) -> int:
+        return int(self._world.hunger[self._index])
+
+    @hunger.setter
+    def hunger(self, value: int):
+        self._world.hunger[self._index] = _clamp10(value)
+
+    @property
+    def energy(self) -> int:
+        return int(self._world.energy[self._index])
+
+    @energy.setter
+    def energy(self, value: int):
+        self._world.energy[self._index] = _clamp10(value)
+
+    @property
+    def happiness(self) -> int:
+        return int(self._world.happiness[self._index])
+
+    @happiness.setter
+    def happiness(self, value: int):
+        self._world.happiness[self._index] = _clamp10(value)
+
+    def apply_delta(self, hunger: int = 0, energy: int = 0, happiness: int = 0) -> None:
+        """Adjusts all three needs in one call, clamping each to 0-10."""
+        world, i = self._world, self._index
+        world.hunger[i] = _clamp10(int(world.hunger[i]) + hunger)
+        world.energy[i] = _clamp10(int(world.energy[i]) + energy)
+        world.happiness[i] = _clamp10(int(world.happiness[i]) + happiness)
+
+    def __str__(self) -> str:
+        return f"Hunger: {self.hunger}/10, Energy: {self.energy}/10, Happiness: {self.happiness}/10"
+
+class PetWorld:
+    """Stores the needs and traits of many pets as parallel arrays so time can pass for all of them at once."""
+    TRAITS = ("metabolism", "activity", "sociability", "pickiness", "joyfulness", "laziness")
+    RNG_BUFFER_SIZE = 4096
+    GPU_THREADS_PER_BLOCK = 128
+
+    def __init__(self, capacity: int, seed: Optional[int] = None, verbose: bool = True):
+        self.capacity = capacity
+        self.verbose = verbose
+        self._log: List[str] = []
+        self._rng = np.random.default_rng(seed)
+        self._u: List[float] = []
+        self.sim_time = 0.0
+        self.size = 0
+        self.pets: List[Pet] = []
+        self._advanced_pets: List[AdvancedPet] = [] # Need a per-pet disease pass each tick
+        self.hunger = np.zeros(capacity, np.int8)
+        self.energy = np.zeros(capacity, np.int8)
+        self.happiness = np.zeros(capacity, np.int8)
+        self.alive = np.zeros(capacity, np.bool_)
+        for trait in self.TRAITS:
+            setattr(self, trait, np.full(capacity, 128, np.uint8))
+
+    def add_pet(self, pet: Pet) -> int:
+        """Moves a pet's needs and traits into the world and returns its row index.
+
+        From then on the world's tick owns needs decay, so the pet's own time_passes no longer decays needs.
+        """
+        if self.size >= self.capacity:
+            raise ValueError(f"PetWorld is full ({self.capacity} pets).")
+        i = self.size
+        self.hunger[i] = pet.needs.hunger
+        self.energy[i] = pet.needs.energy
+        self.happiness[i] = pet.needs.happiness
+        self.alive[i] = pet.is_alive()
+        for trait in self.TRAITS:
+            getattr(self, trait)[i] = round(pet.trait(trait) * 255)
+        pet.needs = NeedsView(self, i)
+        pet._random = self._urand
+        pet._randint = self._urandint
+        pet.attach(self._now, self._log.append if self.verbose else None)
+        pet._decay = _decayed_by_world
+        pet._on_death = partial(self.alive.__setitem__, i, False)
+        self.pets.append(pet)
+        if isinstance(pet, AdvancedPet):
+            self._advanced_pets.append(pet)
+        self.size += 1
+        return i
+
+    def _urand(self) -> float:
+        """Returns the next uniform draw in [0, 1), refilling the buffer in one NumPy call when empty."""
+        if not self._u:
+            self._u = self._rng.random(self.RNG_BUFFER_SIZE).tolist()
+        return self._u.pop()
+
+    def _urandint(self, a: int, b: int) -> int:
+        """Drop-in for random.randint backed by the same buffer."""
+        return a + int(self._urand() * (b - a + 1))
+
+    def _now(self) -> float:
+        """Clock for pets in this world: simulated seconds instead of wall time."""
+        return self.sim_time
+
+    def any_alive(self) -> bool:
+        """Checks whether any pet in the world is still alive, without visiting the Pet objects."""
+        return bool(self.alive[:self.size].any())
+
+    def time_passes(self, seconds: float) -> None:
+        """Advances the simulated clock and every living pet by the given number of seconds."""
+        self.sim_time += seconds
+        n = self.size
+        alive = self.alive[:n]
+        if not alive.any():
+            self.flush_log()
+            return
+        hunger, energy, happiness = self.hunger[:n], self.energy[:n], self.happiness[:n]
+        was_alive = alive.copy()
+
+        if tick is not None:
+            tick(hunger, energy, happiness, self.metabolism[:n], self.activity[:n], self.sociability[:n],
+                 _HUNGER_PERIOD, _ENERGY_PERIOD, _HAPPINESS_PERIOD, alive, float(seconds))
+        else:
+            # Same rates as Pet.time_passes; capping at 10 keeps the int8 sums from overflowing
+            hunger_increase = np.minimum(seconds / _HUNGER_PERIOD[self.metabolism[:n]], 10).astype(np.int8)
+            energy_decrease = np.minimum(seconds / _ENERGY_PERIOD[self.activity[:n]], 10).astype(np.int8)
+            happiness_decrease = np.minimum(seconds / _HAPPINESS_PERIOD[self.sociability[:n]], 10).astype(np.int8)
+            hunger_increase[~alive] = 0
+            energy_decrease[~alive] = 0
+            happiness_decrease[~alive] = 0
+
+            np.clip(hunger + hunger_increase, 0, 10, out=hunger)
+            np.clip(energy - energy_decrease, 0, 10, out=energy)
+            np.clip(happiness - happiness_decrease, 0, 10, out=happiness)
+            alive &= ~((hunger >= 10) | (energy <= 0) | (happiness <= 0))
+
+        self._report_deaths(was_alive & ~alive)
+        # Disease progression stays per pet, as in AdvancedPet.time_passes
+        for pet in self._advanced_pets:
+            pet._progress_diseases()
+        self.flush_log()
+
+    def run(self, ticks: int, seconds: float) -> None:
+        """Calls time_passes the given number of times, keeping the state on the GPU throughout when CUDA is available.
+
+        Falls back to the CPU tick while any AdvancedPet has a disease, since that pass runs per pet.
+        """
+        if cuda is None or not cuda.is_available() or any(pet._diseases for pet in self._advanced_pets):
+            for _ in range(ticks):
+                self.time_passes(seconds)
+            return
+        n = self.size
+        was_alive = self.alive[:n].copy()
+        columns = [cuda.to_device(column[:n]) for column in
+                   (self.hunger, self.energy, self.happiness, self.metabolism, self.activity, self.sociability)]
+        tables = [cuda.to_device(table) for table in (_HUNGER_PERIOD, _ENERGY_PERIOD, _HAPPINESS_PERIOD)]
+        alive = cuda.to_device(self.alive[:n])
+        blocks = (n + self.GPU_THREADS_PER_BLOCK - 1) // self.GPU_THREADS_PER_BLOCK
+        for _ in range(ticks):
+            tick_gpu[blocks, self.GPU_THREADS_PER_BLOCK](*columns, *tables, alive, float(seconds))
+        for column, device_column in zip((self.hunger, self.energy, self.happiness), columns):
+            device_column.copy_to_host(column[:n])
+        alive.copy_to_host(self.alive[:n])
+        self.sim_time += ticks * seconds
+        self._report_deaths(was_alive & ~self.alive[:n])
+        self.flush_log()
+
+    def _report_deaths(self, died: np.ndarray) -> None:
+        """Marks the pets flagged in died as dead of neglect."""
+        for i in np.flatnonzero(died):
+            pet = self.pets[i]
+            pet._is_alive = False
+            if self.verbose:
+                self._log.append(f"{pet.name} has passed away due to neglect.")
+
+    def flush_log(self) -> None:
+        """Writes the buffered pet messages to stdout in a single call."""
+        if self._log:
+            self._log.append("")
+            sys.stdout.write("\n".join(self._log))
+            self._log.clear()
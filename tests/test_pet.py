@@ -0,0 +1,125 @@
+"""Checks Pet and AdvancedPet behaviour that the optimizations must keep.
+
+Run with pytest, or directly: python tests/test_pet.py
+"""
+import copy
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pet import Pet, AdvancedPet, Personality
+from pet_world import PetWorld
+
+class Dog(Pet):
+    def __init__(self, name: str, breed: str = "Beagle"):
+        super().__init__(name, "Dog", personality_traits={"metabolism": 0.2})
+        self.breed = breed
+
+def _round_trip(pet: Pet) -> Pet:
+    return pickle.loads(pickle.dumps(pet))
+
+def test_pickle_pet():
+    pet = Pet("Buddy", initial_hunger=3, personality_traits={"laziness": 0.9})
+    pet._emit = None
+    pet.train("Sit")
+    clone = _round_trip(pet)
+    assert str(clone.needs) == str(pet.needs)
+    assert clone.tricks == pet.tricks and clone.trait("laziness") == 0.9
+    clone._emit = None
+    clone.sleep()
+    assert clone.needs.energy == 10
+
+def test_pickle_advanced_pet_with_disease():
+    pet = AdvancedPet("Patch", personality_traits={"cooperativeness": 1.0})
+    pet._emit = None
+    pet.contract_disease("Flu")
+    clone = _round_trip(pet)
+    assert clone.health == pet.health and str(clone.needs) == str(pet.needs)
+    assert clone._diseases == ["Flu"] and clone._joined_diseases() == "Flu"
+    clone._emit = None
+    clone._random = lambda: 0.0
+    clone.treat_disease("flu")
+    assert clone._diseases == []
+
+def test_pickle_world_pet():
+    world = PetWorld(1, verbose=False)
+    pet = Pet("Buddy")
+    world.add_pet(pet)
+    world.time_passes(3600)
+    clone = _round_trip(pet)
+    assert str(clone.needs) == str(pet.needs)
+    assert not hasattr(clone.needs, "_world") # Detached from the world
+    clone._emit = None
+    clone.eat()
+    assert str(pet.needs) != str(clone.needs)
+
+def test_copy_detaches_world_pet():
+    world = PetWorld(1, verbose=False)
+    pet = Pet("Buddy")
+    world.add_pet(pet)
+    clone = copy.copy(pet)
+    clone._emit = None
+    clone.play()
+    assert str(pet.needs) != str(clone.needs)
+    assert clone._clock is not pet._clock
+
+def test_pickle_and_copy_keep_subclass_attributes():
+    dog = Dog("Rex", breed="Collie")
+    for clone in (_round_trip(dog), copy.copy(dog), copy.deepcopy(dog)):
+        assert clone.breed == "Collie" and clone.name == "Rex" and clone.trait("metabolism") == 0.2
+
+def test_assigning_personality_updates_behaviour():
+    pet = AdvancedPet("Patch", initial_energy=0)
+    pet._emit = None
+    pet.personality = Personality("Sleepy", {"laziness": 1.0, "cooperativeness": 0.0})
+    assert pet.trait("laziness") == 1.0 and pet.personality.name == "Sleepy"
+    pet.sleep()
+    assert pet.needs.energy == 7
+    assert pet._treat_success_chance == 0.0
+
+def test_tricks_and_diseases_ignore_case():
+    pet = AdvancedPet("Patch", personality_traits={"cooperativeness": 1.0})
+    pet._emit = None
+    pet._random = lambda: 0.0 # Training and treatment always succeed
+    pet.train("Sit")
+    pet.train("SIT")
+    assert pet.tricks == ["Sit"]
+    pet.contract_disease("Flu")
+    pet.contract_disease("flu")
+    assert pet._diseases == ["Flu"]
+    pet.treat_disease("FLU") # Cures the disease under its original spelling
+    assert pet._diseases == [] and "flu" not in pet._diseases_lc
+    pet.contract_disease("flu")
+    assert pet._diseases == ["flu"]
+
+def test_joined_strings_follow_changes():
+    pet = AdvancedPet("Patch", personality_traits={"cooperativeness": 1.0})
+    pet._emit = None
+    pet._random = lambda: 0.0
+    assert pet._joined_tricks() == ""
+    pet.train("Sit")
+    assert pet._joined_tricks() == "Sit"
+    pet.train("Roll")
+    assert pet._joined_tricks() == "Sit, Roll"
+    pet.contract_disease("Flu")
+    assert pet._joined_diseases() == "Flu"
+    pet.contract_disease("Cold")
+    assert pet._joined_diseases() == "Flu, Cold"
+    pet._random = lambda: 0.99 # Failed treatment leaves the list alone
+    pet.treat_disease("Flu")
+    assert pet._joined_diseases() == "Flu, Cold"
+    pet._random = lambda: 0.0
+    pet.treat_disease("Flu")
+    assert pet._joined_diseases() == "Cold"
+    messages = []
+    pet._emit = messages.append
+    pet.get_status()
+    assert "Diseases: Cold" in messages
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name} passed")
@@ -0,0 +1,88 @@
+"""Checks that PetWorld's NumPy and Numba ticks match standalone Pet.time_passes.
+
+Run with pytest, or directly: python tests/test_pet_world.py
+"""
+import os
+import random
+import sys
+from unittest import SkipTest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pet_world
+from pet import Pet, AdvancedPet
+from pet_world import PetWorld
+
+TICKS = 4
+DT = 900
+
+def _make_pets(count: int, seed: int = 1):
+    rng = random.Random(seed)
+    pets = []
+    for i in range(count):
+        # Multiples of 1/255 survive PetWorld's uint8 trait quantization exactly
+        traits = {trait: rng.randint(0, 255) / 255 for trait in ("metabolism", "activity", "sociability")}
+        pets.append(Pet(str(i), initial_hunger=rng.randint(0, 9), initial_energy=rng.randint(1, 10),
+                        initial_happiness=rng.randint(1, 10), personality_traits=traits))
+    return pets
+
+def _standalone_results(count: int):
+    now = [0.0]
+    pets = _make_pets(count)
+    for pet in pets:
+        pet.attach(lambda: now[0], None)
+    for _ in range(TICKS):
+        now[0] += DT
+        for pet in pets:
+            pet.time_passes(DT)
+    return [(p.needs.hunger, p.needs.energy, p.needs.happiness, p.is_alive()) for p in pets]
+
+def _world_results(count: int):
+    world = PetWorld(count, verbose=False)
+    pets = _make_pets(count)
+    for pet in pets:
+        world.add_pet(pet)
+    for _ in range(TICKS):
+        world.time_passes(DT)
+    return [(p.needs.hunger, p.needs.energy, p.needs.happiness, p.is_alive()) for p in pets]
+
+def test_numpy_tick_matches_standalone_pets():
+    kernel, pet_world.tick = pet_world.tick, None
+    try:
+        assert _world_results(500) == _standalone_results(500)
+    finally:
+        pet_world.tick = kernel
+
+def test_numba_tick_matches_standalone_pets():
+    if pet_world.tick is None:
+        raise SkipTest("Numba not installed") # pytest reports this as a skip
+    assert _world_results(500) == _standalone_results(500)
+
+def test_pet_time_passes_does_not_repeat_world_decay():
+    world = PetWorld(1, verbose=False)
+    pet = Pet("Buddy")
+    world.add_pet(pet)
+    world.time_passes(3600)
+    needs = str(pet.needs)
+    pet.time_passes(3600)
+    assert str(pet.needs) == needs and pet.is_alive()
+
+def test_world_progresses_diseases():
+    world = PetWorld(1, seed=3, verbose=False)
+    pet = AdvancedPet("Patch", initial_hunger=0, initial_energy=10, initial_happiness=10)
+    world.add_pet(pet)
+    pet.contract_disease("flu")
+    health = pet.health
+    for _ in range(50):
+        world.time_passes(1)
+    assert pet.health < health
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            try:
+                test()
+            except SkipTest as skip:
+                print(f"{name} skipped: {skip}")
+            else:
+                print(f"{name} passed")